@@ -3,7 +3,10 @@ import re
 import json
 import io
 import tempfile
+import zlib
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import RedirectResponse, Response, StreamingResponse
@@ -13,6 +16,9 @@ import qrcode
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject, DictionaryObject, FloatObject, IndirectObject, NameObject, NumberObject, StreamObject,
+)
 from PIL import Image
 
 # Pydantic models for poster generation
@@ -230,6 +236,232 @@ def create_qr_overlay_pdf(qr_png_data: bytes, x: float, y: float, qr_size: float
     buffer.seek(0)
     return buffer.read()
 
+@dataclass(frozen=True)
+class PosterTemplate:
+    """Raw template bytes plus the parsed page state needed to append an incremental update"""
+    data: bytes
+    page_ref: IndirectObject
+    page: DictionaryObject
+    resources: DictionaryObject
+    xobjects: DictionaryObject
+    contents: list
+    mediabox: list
+    trailer: DictionaryObject
+    size: int
+    startxref: int
+    xref_stream: bool
+
+    @property
+    def width(self) -> float:
+        return float(self.mediabox[2]) - float(self.mediabox[0])
+
+    @property
+    def height(self) -> float:
+        return float(self.mediabox[3]) - float(self.mediabox[1])
+
+@lru_cache(maxsize=32)
+def load_poster_template(template_path: str) -> PosterTemplate:
+    """Read a template PDF once and keep its bytes and first page in memory"""
+    with open(template_path, 'rb') as f:
+        data = f.read()
+
+    reader = PdfReader(io.BytesIO(data))
+    if reader.is_encrypted or len(reader.pages) != 1:
+        raise ValueError(f"Template '{template_path}' must be a single-page, unencrypted PDF")
+
+    page = reader.pages[0]
+
+    # Resolve everything the update touches now, so rendering never reads from the template again
+    resources = DictionaryObject(page["/Resources"]) if "/Resources" in page else DictionaryObject()
+    xobjects = DictionaryObject(resources["/XObject"]) if "/XObject" in resources else DictionaryObject()
+    contents = []
+    if "/Contents" in page:
+        raw_contents = page.raw_get("/Contents")
+        if isinstance(raw_contents.get_object(), ArrayObject):
+            contents = list(raw_contents.get_object())
+        else:
+            contents = [raw_contents]
+
+    trailer = DictionaryObject({
+        NameObject(key): reader.trailer.raw_get(key)
+        for key in ("/Root", "/Info", "/ID")
+        if key in reader.trailer
+    })
+
+    startxref = int(data[data.rindex(b"startxref") + len(b"startxref"):].split()[0])
+
+    return PosterTemplate(
+        data=data,
+        page_ref=page.indirect_reference,
+        page=DictionaryObject(page),
+        resources=resources,
+        xobjects=xobjects,
+        contents=contents,
+        mediabox=[float(v) for v in page.mediabox],
+        trailer=trailer,
+        size=int(reader.trailer["/Size"]),
+        startxref=startxref,
+        xref_stream=not data[startxref:].lstrip().startswith(b"xref"),
+    )
+
+def serialize_pdf_object(obj) -> bytes:
+    """Serialize a pypdf object (stream or direct object) to bytes"""
+    buffer = io.BytesIO()
+    obj.write_to_stream(buffer)
+    return buffer.getvalue()
+
+def flate_stream(data: bytes, entries: Optional[dict] = None) -> StreamObject:
+    """Build a FlateDecode stream object from raw bytes"""
+    stream = StreamObject()
+    stream.update(entries or {})
+    stream[NameObject("/Filter")] = NameObject("/FlateDecode")
+    stream.set_data(zlib.compress(data))
+    return stream
+
+class IncrementalUpdate:
+    """Collects new and replaced objects and appends them to a template as a PDF incremental update"""
+
+    def __init__(self, template: PosterTemplate):
+        self.template = template
+        self.next_number = template.size
+        self.objects = {}  # object number -> (generation, serialized body)
+        self.imported = {}  # foreign object number -> new reference
+
+    def allocate(self) -> IndirectObject:
+        ref = IndirectObject(self.next_number, 0, None)
+        self.next_number += 1
+        return ref
+
+    def add(self, obj) -> IndirectObject:
+        ref = self.allocate()
+        self.objects[ref.idnum] = (0, serialize_pdf_object(obj))
+        return ref
+
+    def replace(self, ref: IndirectObject, obj) -> None:
+        self.objects[ref.idnum] = (ref.generation, serialize_pdf_object(obj))
+
+    def import_object(self, obj):
+        """Copy an object graph from another (throwaway) document, renumbering its references"""
+        if isinstance(obj, IndirectObject):
+            if obj.idnum not in self.imported:
+                ref = self.imported[obj.idnum] = self.allocate()
+                self.objects[ref.idnum] = (0, serialize_pdf_object(self.import_object(obj.get_object())))
+            return self.imported[obj.idnum]
+        if isinstance(obj, DictionaryObject):
+            for key, value in list(obj.items()):
+                obj[key] = self.import_object(value)
+        elif isinstance(obj, ArrayObject):
+            for index, value in enumerate(obj):
+                obj[index] = self.import_object(value)
+        return obj
+
+    def write(self) -> bytes:
+        """Return the template bytes followed by the new objects and cross-reference section"""
+        template = self.template
+        output = io.BytesIO()
+        output.write(template.data)
+        if not template.data.endswith(b"\n"):
+            output.write(b"\n")
+
+        offsets = {}
+        for number, (generation, body) in sorted(self.objects.items()):
+            offsets[number] = (output.tell(), generation)
+            output.write(f"{number} {generation} obj\n".encode())
+            output.write(body)
+            output.write(b"\nendobj\n")
+
+        trailer = DictionaryObject(template.trailer)
+        trailer[NameObject("/Prev")] = NumberObject(template.startxref)
+
+        if template.xref_stream:
+            # Templates with cross-reference streams must be updated with one too
+            xref_ref = self.allocate()
+            offsets[xref_ref.idnum] = (output.tell(), 0)
+            xref_offset = output.tell()
+            offset_width = max(4, (xref_offset.bit_length() + 7) // 8)
+            numbers = sorted(offsets)
+            rows = b"".join(
+                b"\x01" + offsets[n][0].to_bytes(offset_width, "big") + offsets[n][1].to_bytes(2, "big")
+                for n in numbers
+            )
+            trailer.update({
+                NameObject("/Type"): NameObject("/XRef"),
+                NameObject("/Size"): NumberObject(self.next_number),
+                NameObject("/W"): ArrayObject([NumberObject(1), NumberObject(offset_width), NumberObject(2)]),
+                NameObject("/Index"): ArrayObject(
+                    NumberObject(v) for start, count in xref_subsections(numbers) for v in (start, count)
+                ),
+            })
+            output.write(f"{xref_ref.idnum} 0 obj\n".encode())
+            output.write(serialize_pdf_object(flate_stream(rows, trailer)))
+            output.write(b"\nendobj\n")
+        else:
+            xref_offset = output.tell()
+            # Lead with the free-list head so readers don't mistake the section for a misnumbered table
+            output.write(b"xref\n0 1\n0000000000 65535 f\r\n")
+            numbers = sorted(offsets)
+            for start, count in xref_subsections(numbers):
+                output.write(f"{start} {count}\n".encode())
+                for number in range(start, start + count):
+                    offset, generation = offsets[number]
+                    output.write(f"{offset:010d} {generation:05d} n\r\n".encode())
+            trailer[NameObject("/Size")] = NumberObject(self.next_number)
+            output.write(b"trailer\n")
+            output.write(serialize_pdf_object(trailer))
+            output.write(b"\n")
+
+        output.write(f"startxref\n{xref_offset}\n%%EOF\n".encode())
+        return output.getvalue()
+
+def xref_subsections(numbers: list) -> list:
+    """Group sorted object numbers into (first, count) runs of consecutive numbers"""
+    subsections = []
+    for number in numbers:
+        if subsections and subsections[-1][0] + subsections[-1][1] == number:
+            subsections[-1][1] += 1
+        else:
+            subsections.append([number, 1])
+    return [tuple(subsection) for subsection in subsections]
+
+def append_overlay_update(template: PosterTemplate, overlay_pdf_data: bytes) -> bytes:
+    """Stamp the first page of an overlay PDF onto the template via an incremental update.
+
+    The overlay is wrapped in a Form XObject drawn after the template content, which is
+    isolated in q/Q exactly like pypdf's merge_page does. Template bytes are copied as-is.
+    """
+    update = IncrementalUpdate(template)
+    overlay_page = PdfReader(io.BytesIO(overlay_pdf_data)).pages[0]
+
+    overlay_resources = update.import_object(overlay_page.raw_get("/Resources"))
+    form_ref = update.add(flate_stream(overlay_page.get_contents().get_data(), {
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Form"),
+        NameObject("/BBox"): ArrayObject(FloatObject(v) for v in template.mediabox),
+        NameObject("/Resources"): overlay_resources,
+    }))
+
+    # Pick a resource name that cannot collide with the template's own XObjects
+    form_name = "/PosterOverlay"
+    suffix = 0
+    while form_name in template.xobjects:
+        suffix += 1
+        form_name = f"/PosterOverlay{suffix}"
+
+    xobjects = DictionaryObject(template.xobjects)
+    xobjects[NameObject(form_name)] = form_ref
+    resources = DictionaryObject(template.resources)
+    resources[NameObject("/XObject")] = xobjects
+
+    prefix_ref = update.add(flate_stream(b"q\n"))
+    suffix_ref = update.add(flate_stream(f"Q\nq\n{form_name} Do\nQ\n".encode()))
+
+    page = DictionaryObject(template.page)
+    page[NameObject("/Resources")] = resources
+    page[NameObject("/Contents")] = ArrayObject([prefix_ref, *template.contents, suffix_ref])
+    update.replace(template.page_ref, page)
+
+    return update.write()
+
 def generate_poster_pdf(content: str, campaign_slug: str, style: str,
                        referral_code: Optional[str] = None) -> bytes:
     """Generate a complete poster PDF with QR code overlay"""
@@ -247,13 +479,8 @@ def generate_poster_pdf(content: str, campaign_slug: str, style: str,
     qr_size = qr_config['size']
     qr_png_data = generate_qr_code_png(content, size=int(qr_size))
 
-    # Load template PDF
-    template_reader = PdfReader(template_path)
-    first_page = template_reader.pages[0]
-
-    # Get page dimensions
-    page_width = float(first_page.mediabox.width)
-    page_height = float(first_page.mediabox.height)
+    # Load template PDF (cached; the template is never re-encoded)
+    template = load_poster_template(template_path)
 
     # Create overlay PDF
     overlay_pdf_data = create_qr_overlay_pdf(
@@ -261,31 +488,14 @@ def generate_poster_pdf(content: str, campaign_slug: str, style: str,
         x=qr_config['x'],
         y=qr_config['y'],
         qr_size=qr_size,
-        page_width=page_width,
-        page_height=page_height,
+        page_width=template.width,
+        page_height=template.height,
         referral_code=referral_code,
         text_config=text_config
     )
 
-    # Merge overlay with template
-    overlay_reader = PdfReader(io.BytesIO(overlay_pdf_data))
-
-    # Create output PDF with compression
-    writer = PdfWriter()
-    first_page.merge_page(overlay_reader.pages[0])
-    writer.add_page(first_page)
-
-    # Write to bytes with compression
-    output_buffer = io.BytesIO()
-
-    # Add compression to writer before writing
-    for page in writer.pages:
-        page.compress_content_streams()
-
-    writer.write(output_buffer)
-    output_buffer.seek(0)
-
-    return output_buffer.read()
+    # Append the overlay to the untouched template bytes as an incremental update
+    return append_overlay_update(template, overlay_pdf_data)
 
 @app.on_event("startup")
 async def startup():